@@ -0,0 +1 @@
+"""Headless performance benchmarks for the CS2 launcher's hot paths."""
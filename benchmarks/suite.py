@@ -0,0 +1,415 @@
+"""Benchmark cases, runner and baseline comparison.
+
+Run from the repository root::
+
+    python -m benchmarks            # compare against benchmarks/baseline.json
+    python -m benchmarks --update   # record a new baseline
+
+Every metric is the fastest wall time of one sample in milliseconds.
+Operations that take well under ``DEFAULT_FLOOR_MS`` are timed in batches
+of N calls per sample (the ``_xN`` suffix) so that a real slowdown can
+clear the floor. The suite runs under the ``offscreen`` Qt platform, keeps settings in a scratch
+directory and puts a fake ``steam`` executable first on ``PATH``.
+
+Timings only compare within one machine class, so the regression gate is
+skipped with a warning when the baseline was recorded on different
+hardware or a different Python/PySide build.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtGui, QtWidgets  # noqa: E402
+
+from cs2_launcher import main as launcher  # noqa: E402
+from cs2_launcher import theme  # noqa: E402
+
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_REPEAT = 25
+WARMUP = 3
+RETRIES = 3
+RETRY_DELAY_S = 2.0
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_FLOOR_MS = 0.5
+PAINT_SIZE = QtCore.QSize(960, 600)
+WALLPAPER_RESOLUTIONS = [(1280, 720), (1920, 1080), (2560, 1440), (3840, 2160)]
+PARTICLE_DENSITIES = [25, 100, 400]
+PARTICLE_FRAME_MS = 16
+PARTICLE_FRAMES_PER_SAMPLE = 10
+SETTINGS_BATCH = 50
+LAUNCH_ARGS_BATCH = 200
+
+
+def measure(operation: Callable[[], object], repeat: int, *, batch: int = 1) -> float:
+    """Return the fastest time of ``batch`` calls to ``operation`` in milliseconds.
+
+    The minimum is used rather than the median because scheduler and cache
+    noise only ever adds time, so it is the most repeatable estimate on
+    shared CI machines.
+    """
+    for _ in range(WARMUP):
+        operation()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(batch):
+            operation()
+        samples.append(time.perf_counter() - start)
+    return min(samples) * 1000
+
+
+class Workspace:
+    """Scratch settings file, generated wallpapers and a fake Steam install."""
+
+    def __init__(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(prefix="cs2-bench-")
+        self.root = Path(self._tmp.name)
+        self._saved_settings_path = launcher.SETTINGS_PATH
+        self._saved_path = os.environ.get("PATH", "")
+
+    def __enter__(self) -> "Workspace":
+        launcher.SETTINGS_PATH = self.root / "settings.json"
+        bin_dir = self.root / "bin"
+        bin_dir.mkdir()
+        steam = bin_dir / "steam"
+        steam.write_text("#!/bin/sh\nexit 0\n")
+        steam.chmod(0o755)
+        os.environ["PATH"] = os.pathsep.join([str(bin_dir), self._saved_path])
+        self.steam_path = str(steam)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        launcher.SETTINGS_PATH = self._saved_settings_path
+        os.environ["PATH"] = self._saved_path
+        self._tmp.cleanup()
+
+    def wallpaper(self, width: int, height: int) -> Path:
+        path = self.root / f"wallpaper_{width}x{height}.png"
+        if not path.exists():
+            image = QtGui.QImage(width, height, QtGui.QImage.Format.Format_RGB32)
+            painter = QtGui.QPainter(image)
+            gradient = QtGui.QLinearGradient(0, 0, width, height)
+            gradient.setColorAt(0.0, QtGui.QColor(40, 10, 60))
+            gradient.setColorAt(1.0, QtGui.QColor(200, 120, 30))
+            painter.fillRect(image.rect(), gradient)
+            painter.end()
+            image.save(str(path))
+        return path
+
+
+def _discard(widgets: List[QtWidgets.QWidget]) -> None:
+    for widget in widgets:
+        widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+
+
+def _paint_cost(widget: QtWidgets.QWidget, repeat: int) -> float:
+    widget.resize(PAINT_SIZE)
+    target = QtGui.QImage(PAINT_SIZE, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    return measure(lambda: widget.render(target), repeat)
+
+
+# region Cases
+def bench_window_construction(workspace: Workspace, repeat: int) -> Dict[str, float]:
+    windows: List[QtWidgets.QWidget] = []
+    elapsed = measure(lambda: windows.append(launcher.LauncherWindow()), repeat)
+    _discard(windows)
+    return {"window_construct": elapsed}
+
+
+def bench_settings(workspace: Workspace, repeat: int) -> Dict[str, float]:
+    window = launcher.LauncherWindow()
+    results = {
+        f"settings_save_x{SETTINGS_BATCH}": measure(window._save_settings, repeat, batch=SETTINGS_BATCH),
+        f"settings_load_x{SETTINGS_BATCH}": measure(window._load_settings, repeat, batch=SETTINGS_BATCH),
+    }
+    _discard([window])
+    return results
+
+
+def bench_wallpaper(workspace: Workspace, repeat: int) -> Dict[str, float]:
+    backdrop = launcher.AetherBackdrop()
+    backdrop.resize(PAINT_SIZE)
+    results = {}
+    for width, height in WALLPAPER_RESOLUTIONS:
+        path = workspace.wallpaper(width, height)
+
+        def decode_and_rescale(path: Path = path) -> None:
+            backdrop.set_image(path)
+            backdrop.grab()
+
+        results[f"wallpaper_decode_rescale_{width}x{height}"] = measure(decode_and_rescale, repeat)
+    _discard([backdrop])
+    return results
+
+
+def bench_overlay_paint(workspace: Workspace, repeat: int) -> Dict[str, float]:
+    scanlines = launcher.ScanlineOverlay()
+    frame = launcher.NeonFrame(accent_color=theme.DEFAULT_ACCENT)
+    results = {
+        "scanline_paint": _paint_cost(scanlines, repeat),
+        "neon_frame_paint": _paint_cost(frame, repeat),
+    }
+    _discard([scanlines, frame])
+    return results
+
+
+def bench_particles(workspace: Workspace, repeat: int) -> Dict[str, float]:
+    window = launcher.LauncherWindow()
+    window.resize(PAINT_SIZE)
+    window.show()
+    QtCore.QCoreApplication.processEvents()
+    viewport = window.particle_view.viewport()
+    target = QtGui.QImage(viewport.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    results = {}
+    for density in PARTICLE_DENSITIES:
+        window.particle_checkbox.setChecked(False)
+        window.particle_checkbox.setChecked(True)
+        # Frames are stepped by hand, so keep the spawn timer out of the way.
+        window._particle_timer.stop()
+        for _ in range(density):
+            window._spawn_particle()
+        animations = [
+            animation
+            for animation in window.particle_scene.findChildren(QtCore.QVariantAnimation)
+            if animation.state() == QtCore.QAbstractAnimation.State.Running
+        ]
+        clock = [0]
+
+        def frame(animations: List[QtCore.QVariantAnimation] = animations) -> None:
+            clock[0] = (clock[0] + PARTICLE_FRAME_MS) % 5000
+            for animation in animations:
+                animation.setCurrentTime(clock[0])
+            viewport.render(target)
+
+        results[f"particle_frame_{density}_x{PARTICLE_FRAMES_PER_SAMPLE}"] = measure(
+            frame, repeat, batch=PARTICLE_FRAMES_PER_SAMPLE
+        )
+    window.particle_checkbox.setChecked(False)
+    window.hide()
+    _discard([window])
+    return results
+
+
+def bench_launch_args(workspace: Workspace, repeat: int) -> Dict[str, float]:
+    window = launcher.LauncherWindow()
+    steam_cmd = window._detect_steam_command()
+    if steam_cmd != workspace.steam_path:
+        raise RuntimeError(f"Fake steam was not picked up from PATH (found {steam_cmd!r})")
+
+    def build() -> List[str]:
+        return window._build_launch_args(window._detect_steam_command())
+
+    results = {f"launch_args_build_x{LAUNCH_ARGS_BATCH}": measure(build, repeat, batch=LAUNCH_ARGS_BATCH)}
+    _discard([window])
+    return results
+
+
+CASES = [
+    bench_window_construction,
+    bench_settings,
+    bench_wallpaper,
+    bench_overlay_paint,
+    bench_particles,
+    bench_launch_args,
+]
+
+# endregion
+
+
+# region Runner
+Case = Callable[[Workspace, int], Dict[str, float]]
+
+
+def run_suite(repeat: int = DEFAULT_REPEAT, cases: Sequence[Case] = CASES) -> Dict[Case, Dict[str, float]]:
+    """Run ``cases`` and return the metrics each of them produced."""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    app.setApplicationName(launcher.APP_NAME)
+    results: Dict[Case, Dict[str, float]] = {}
+    with Workspace() as workspace:
+        for case in cases:
+            results[case] = case(workspace, repeat)
+    return results
+
+
+def _flatten(results: Dict[Case, Dict[str, float]]) -> Dict[str, float]:
+    return {name: value for metrics in results.values() for name, value in metrics.items()}
+
+
+def record_baseline(results: Dict[Case, Dict[str, float]], *, repeat: int) -> None:
+    """Rerun every case after a pause and keep the best time seen.
+
+    A baseline recorded during a burst of host contention would make the
+    gate too lenient, so it gets the same retries as a regression does.
+    """
+    for _ in range(RETRIES):
+        time.sleep(RETRY_DELAY_S)
+        for case, metrics in run_suite(repeat, list(results)).items():
+            for name, value in metrics.items():
+                results[case][name] = min(results[case][name], value)
+
+
+def confirm_regressions(
+    results: Dict[Case, Dict[str, float]],
+    baseline: Dict[str, float],
+    *,
+    repeat: int,
+    tolerance: float,
+    floor_ms: float,
+) -> List[Tuple[str, float, float]]:
+    """Rerun the cases behind any regressed metric and keep the faster result.
+
+    Host contention on shared runners slows every metric for a few seconds
+    at a time, so each retry waits ``RETRY_DELAY_S`` first. A slowdown only
+    fails the suite if it shows up on every retry. ``results`` is updated in
+    place with the best times seen.
+    """
+    regressions = compare(_flatten(results), baseline, tolerance=tolerance, floor_ms=floor_ms)
+    for _ in range(RETRIES):
+        if not regressions:
+            break
+        regressed = {name for name, _base, _current in regressions}
+        suspects = [case for case, metrics in results.items() if regressed & metrics.keys()]
+        time.sleep(RETRY_DELAY_S)
+        for case, metrics in run_suite(repeat, suspects).items():
+            for name, value in metrics.items():
+                results[case][name] = min(results[case][name], value)
+        regressions = compare(_flatten(results), baseline, tolerance=tolerance, floor_ms=floor_ms)
+    return regressions
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine class a run's timings belong to.
+
+    Only what changes the timings is recorded: kernel and patch releases
+    are left out so a routine runner image update does not invalidate the
+    baseline.
+    """
+    from PySide6 import __version__ as pyside_version
+
+    return {
+        "system": f"{platform.system()}-{platform.machine()}",
+        "cpu": _cpu_model(),
+        "cpus": str(len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()),
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "pyside": pyside_version,
+        "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+    }
+
+
+def compare(
+    metrics: Dict[str, float],
+    baseline: Dict[str, float],
+    *,
+    tolerance: float,
+    floor_ms: float,
+) -> List[Tuple[str, float, float]]:
+    """Return ``(name, baseline, current)`` for every metric that regressed.
+
+    A metric regresses when it is slower than ``baseline * (1 + tolerance)``
+    and the absolute slowdown exceeds ``floor_ms``, which keeps
+    sub-millisecond jitter from failing the suite.
+    """
+    regressions = []
+    for name, current in metrics.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if current > reference * (1 + tolerance) and current - reference > floor_ms:
+            regressions.append((name, reference, current))
+    return regressions
+
+
+def _format_row(name: str, current: float, reference: float | None) -> str:
+    if reference is None:
+        return f"{name:<36} {current:10.3f} ms   (new)"
+    change = (current - reference) / reference * 100 if reference else 0.0
+    return f"{name:<36} {current:10.3f} ms   {reference:10.3f} ms   {change:+7.1f}%"
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument("--output", type=Path, help="write this run's results as JSON")
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed iterations per metric")
+    parser.add_argument("--tolerance", type=float, help="allowed relative slowdown (default from baseline)")
+    parser.add_argument("--floor-ms", type=float, default=DEFAULT_FLOOR_MS, help="ignore slowdowns below this")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.repeat)
+    previous = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    tolerance = args.tolerance if args.tolerance is not None else previous.get("tolerance", DEFAULT_TOLERANCE)
+    reference = previous.get("metrics", {})
+    current_environment = environment()
+    recorded_environment = previous.get("environment", {})
+    mismatched = {
+        key: (recorded_environment.get(key), value)
+        for key, value in current_environment.items()
+        if previous and recorded_environment.get(key) != value
+    }
+    regressions: List[Tuple[str, float, float]] = []
+    if args.update:
+        record_baseline(results, repeat=args.repeat)
+    elif previous and not mismatched:
+        regressions = confirm_regressions(
+            results, reference, repeat=args.repeat, tolerance=tolerance, floor_ms=args.floor_ms
+        )
+    metrics = _flatten(results)
+    report = {"environment": current_environment, "tolerance": tolerance, "metrics": metrics}
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not previous:
+        print(f"No baseline at {args.baseline}; run with --update to record one.", file=sys.stderr)
+        return 2
+
+    for name, current in metrics.items():
+        print(_format_row(name, current, reference.get(name)))
+    blind = [name for name, value in reference.items() if value * tolerance <= args.floor_ms]
+    if blind:
+        print(
+            f"\nWarning: a {tolerance:.0%} slowdown stays under the {args.floor_ms:g} ms floor for: "
+            + ", ".join(blind),
+            file=sys.stderr,
+        )
+    if mismatched:
+        print(f"\nBaseline at {args.baseline} was recorded on a different machine class:", file=sys.stderr)
+        for key, (recorded, current) in mismatched.items():
+            print(f"  {key}: {recorded!r} -> {current!r}", file=sys.stderr)
+        print("Regression gate skipped; run with --update on this machine class to enable it.", file=sys.stderr)
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed past {tolerance:.0%}:", file=sys.stderr)
+        for name, base, current in regressions:
+            print(f"  {name}: {base:.3f} ms -> {current:.3f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+# endregion
@@ -0,0 +1,360 @@
+"""Display capability probe for matching launch settings to the monitor."""
+from __future__ import annotations
+
+import os
+import platform
+import re
+import shutil
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from PySide6 import QtCore, QtGui
+
+
+XRANDR_TIMEOUT = 2.0
+REFRESH_TOLERANCE = 1.0
+DEFAULT_DPI = 96.0
+
+_OUTPUT_RE = re.compile(
+    r"^(?P<name>\S+) connected(?P<primary> primary)?"
+    r"(?: (?P<width>\d+)x(?P<height>\d+)\+(?P<x>\d+)\+(?P<y>\d+))?"
+    r".*?(?:(?P<mm_width>\d+)mm x (?P<mm_height>\d+)mm)?\s*$"
+)
+_MODE_RE = re.compile(r"^\s+(?P<width>\d+)x(?P<height>\d+)i?\s+(?P<rates>.*)$")
+_RATE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([*+]*)")
+
+
+@dataclass(frozen=True)
+class DisplayMode:
+    width: int
+    height: int
+    refresh_rate: float
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+
+@dataclass(frozen=True)
+class DisplayInfo:
+    """Native mode, DPI and supported modes of one attached screen."""
+
+    name: str
+    native: DisplayMode
+    dpi: float
+    primary: bool
+    modes: Tuple[DisplayMode, ...]
+    # Desktop rectangle (x, y, width, height) in device pixels, if known.
+    geometry: Tuple[int, int, int, int] | None = field(default=None, compare=False)
+
+    def is_native(self, width: int, height: int, refresh_rate: float) -> bool:
+        return (
+            self.native.size == (width, height)
+            and abs(self.native.refresh_rate - refresh_rate) < REFRESH_TOLERANCE
+        )
+
+
+def _native_mode(modes: Sequence[DisplayMode], width: int, height: int) -> DisplayMode:
+    # Panels often advertise 60 Hz as the preferred rate; the native refresh
+    # is the fastest rate offered at the native size.
+    rates = [mode.refresh_rate for mode in modes if mode.size == (width, height)]
+    return DisplayMode(width, height, max(rates) if rates else 0.0)
+
+
+def parse_xrandr(output: str) -> List[DisplayInfo]:
+    """Parse ``xrandr --query`` output into one entry per connected output."""
+    displays: List[DisplayInfo] = []
+    current: Dict[str, object] | None = None
+
+    def flush() -> None:
+        if not current or not current["modes"]:
+            return
+        modes: List[DisplayMode] = current["modes"]  # type: ignore[assignment]
+        width, height = current["preferred"] or current["active"] or modes[0].size  # type: ignore[misc]
+        native = _native_mode(modes, width, height)
+        mm_width = current["mm_width"]
+        dpi = native.width / (mm_width / 25.4) if mm_width else DEFAULT_DPI  # type: ignore[operator]
+        displays.append(
+            DisplayInfo(
+                name=str(current["name"]),
+                native=native,
+                dpi=round(dpi, 1),
+                primary=bool(current["primary"]),
+                modes=tuple(modes),
+                geometry=current["geometry"],  # type: ignore[arg-type]
+            )
+        )
+
+    for line in output.splitlines():
+        output_match = _OUTPUT_RE.match(line)
+        if output_match:
+            flush()
+            current = {
+                "name": output_match["name"],
+                "primary": bool(output_match["primary"]),
+                "mm_width": int(output_match["mm_width"] or 0),
+                "geometry": (
+                    tuple(int(output_match[group]) for group in ("x", "y", "width", "height"))
+                    if output_match["width"]
+                    else None
+                ),
+                "modes": [],
+                "preferred": None,
+                "active": None,
+            }
+            continue
+        if not line.startswith((" ", "\t")):
+            flush()
+            current = None
+            continue
+        mode_match = _MODE_RE.match(line)
+        if current is None or not mode_match:
+            continue
+        size = (int(mode_match["width"]), int(mode_match["height"]))
+        for rate, flags in _RATE_RE.findall(mode_match["rates"]):
+            current["modes"].append(DisplayMode(size[0], size[1], float(rate)))  # type: ignore[union-attr]
+            if "+" in flags:
+                current["preferred"] = size
+            if "*" in flags:
+                current["active"] = size
+    flush()
+    return displays
+
+
+def xrandr_command() -> str | None:
+    if platform.system() != "Linux" or not os.environ.get("DISPLAY"):
+        return None
+    return shutil.which("xrandr")
+
+
+def setup_key() -> Tuple[object, ...]:
+    """Identify the current monitor setup for caching."""
+    return tuple(
+        (screen.name(), screen.geometry().getRect(), screen.devicePixelRatio(), screen.refreshRate())
+        for screen in QtGui.QGuiApplication.screens()
+    )
+
+
+def screen_info(screen: QtGui.QScreen, *, primary: bool) -> DisplayInfo:
+    ratio = screen.devicePixelRatio()
+    geometry = screen.geometry()
+    native = DisplayMode(
+        round(geometry.width() * ratio),
+        round(geometry.height() * ratio),
+        round(screen.refreshRate(), 2),
+    )
+    return DisplayInfo(
+        name=screen.name(),
+        native=native,
+        dpi=round(screen.physicalDotsPerInch(), 1) or DEFAULT_DPI,
+        primary=primary,
+        modes=(native,),
+        geometry=(round(geometry.x() * ratio), round(geometry.y() * ratio), native.width, native.height),
+    )
+
+
+def merge_displays(screens: Sequence[DisplayInfo], xrandr: Iterable[DisplayInfo]) -> List[DisplayInfo]:
+    """Prefer xrandr's mode lists for outputs Qt also reports, keeping Qt's order.
+
+    Outputs are matched by name, then by desktop geometry, since XWayland
+    names them differently from the compositor. xrandr-only outputs are
+    used only when Qt reports no screens at all.
+    """
+    unmatched = list(xrandr)
+    if not screens:
+        return unmatched
+    merged = []
+    for info in screens:
+        extra = next((candidate for candidate in unmatched if candidate.name == info.name), None)
+        if extra is None and info.geometry is not None:
+            extra = next((candidate for candidate in unmatched if candidate.geometry == info.geometry), None)
+        if extra is None:
+            merged.append(info)
+            continue
+        unmatched.remove(extra)
+        dpi = info.dpi if info.dpi != DEFAULT_DPI else extra.dpi
+        merged.append(DisplayInfo(info.name, extra.native, dpi, info.primary, extra.modes, info.geometry))
+    return merged
+
+
+def preset_resolutions(
+    displays: Sequence[DisplayInfo], fallback: Sequence[Tuple[int, int]]
+) -> List[Tuple[Tuple[int, int], bool]]:
+    """Return ``((width, height), is_native)`` presets, native modes first.
+
+    Supported modes follow, then fallback presets that fit on the largest
+    native mode.
+    """
+    if not displays:
+        return [(size, False) for size in fallback]
+    ordered = sorted(displays, key=lambda info: not info.primary)
+    presets: Dict[Tuple[int, int], bool] = {}
+    for info in ordered:
+        presets.setdefault(info.native.size, True)
+    for info in ordered:
+        for mode in sorted(info.modes, key=lambda mode: mode.width * mode.height, reverse=True):
+            presets.setdefault(mode.size, False)
+    max_width = max(info.native.width for info in displays)
+    max_height = max(info.native.height for info in displays)
+    for width, height in fallback:
+        if width <= max_width and height <= max_height:
+            presets.setdefault((width, height), False)
+    return list(presets.items())
+
+
+class _XrandrCache(QtCore.QObject):
+    """Process-wide ``xrandr`` results keyed by monitor setup.
+
+    Queries run through :class:`QtCore.QProcess` from the event loop, so
+    building a window never waits on xrandr. Entries are dropped when a
+    screen is added or removed; any other change yields a new key.
+    """
+
+    updated = QtCore.Signal()
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._results: Dict[Tuple[object, ...], List[DisplayInfo]] = {}
+        self._process: QtCore.QProcess | None = None
+        self._pending_key: Tuple[object, ...] = ()
+        self._scheduled = False
+        app = QtGui.QGuiApplication.instance()
+        app.screenAdded.connect(self.clear)
+        app.screenRemoved.connect(self.clear)
+
+    def clear(self, *args: object) -> None:
+        del args
+        self._results.clear()
+
+    def lookup(self, key: Tuple[object, ...]) -> List[DisplayInfo] | None:
+        """Return the outputs cached for ``key``, or ``None`` after scheduling a query."""
+        if key in self._results:
+            return self._results[key]
+        self._schedule()
+        return None
+
+    def _schedule(self) -> None:
+        if self._process is None and not self._scheduled:
+            self._scheduled = True
+            QtCore.QTimer.singleShot(0, self._start)
+
+    def _start(self) -> None:
+        self._scheduled = False
+        key = setup_key()
+        if key in self._results:
+            return
+        command = xrandr_command()
+        if command is None:
+            self._results[key] = []
+            return
+        process = QtCore.QProcess(self)
+        process.finished.connect(self._on_finished)
+        process.errorOccurred.connect(self._on_error)
+        self._process, self._pending_key = process, key
+        QtCore.QTimer.singleShot(int(XRANDR_TIMEOUT * 1000), process, process.kill)
+        process.start(command, ["--query"])
+
+    def _on_finished(self, exit_code: int, exit_status: QtCore.QProcess.ExitStatus) -> None:
+        process = self._process
+        if process is None:
+            return
+        output = bytes(process.readAllStandardOutput()).decode(errors="replace")
+        succeeded = exit_status == QtCore.QProcess.ExitStatus.NormalExit and exit_code == 0
+        displays = parse_xrandr(output) if succeeded else []
+        self._finish(displays)
+
+    def _on_error(self, error: QtCore.QProcess.ProcessError) -> None:
+        # Crashes and timeouts still emit finished(); only a failed start does not.
+        if error == QtCore.QProcess.ProcessError.FailedToStart:
+            self._finish([])
+
+    def _finish(self, displays: List[DisplayInfo]) -> None:
+        if self._process is None:
+            return
+        self._process.deleteLater()
+        self._process = None
+        self._results[self._pending_key] = displays
+        if setup_key() != self._pending_key:
+            # The setup changed mid-query; lookups for the new key are waiting on us.
+            self._schedule()
+        elif displays:
+            self.updated.emit()
+
+
+_xrandr_cache: _XrandrCache | None = None
+
+
+def _forget_xrandr_cache(*args: object) -> None:
+    global _xrandr_cache
+    del args
+    _xrandr_cache = None
+
+
+def _shared_xrandr_cache() -> _XrandrCache:
+    """Return the cache owned by the running application, creating it if needed."""
+    global _xrandr_cache
+    if _xrandr_cache is None:
+        app = QtGui.QGuiApplication.instance()
+        _xrandr_cache = _XrandrCache(app)
+        # The cache dies with its application; a later one gets a fresh cache.
+        app.destroyed.connect(_forget_xrandr_cache)
+    return _xrandr_cache
+
+
+class DisplayProbe(QtCore.QObject):
+    """Reports display capabilities for the current monitor setup.
+
+    Results are kept until the setup changes; xrandr mode lists come from
+    a process-wide cache keyed by :func:`setup_key`. :attr:`displaysChanged`
+    is emitted once per event-loop pass after a screen is added, removed,
+    becomes primary or changes geometry, refresh rate or DPI, or when an
+    xrandr query completes.
+    """
+
+    displaysChanged = QtCore.Signal()
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._changed_timer = QtCore.QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(0)
+        self._changed_timer.timeout.connect(self.displaysChanged.emit)
+        self._displays: Tuple[Tuple[object, ...], List[DisplayInfo]] | None = None
+        self._xrandr = _shared_xrandr_cache()
+        self._xrandr.updated.connect(self.invalidate)
+        app = QtGui.QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self.invalidate)
+        app.primaryScreenChanged.connect(self.invalidate)
+        for screen in QtGui.QGuiApplication.screens():
+            self._watch(screen)
+
+    def _watch(self, screen: QtGui.QScreen) -> None:
+        screen.geometryChanged.connect(self.invalidate)
+        screen.refreshRateChanged.connect(self.invalidate)
+        screen.physicalDotsPerInchChanged.connect(self.invalidate)
+
+    def _on_screen_added(self, screen: QtGui.QScreen) -> None:
+        self._watch(screen)
+        self.invalidate()
+
+    def invalidate(self, *args: object) -> None:
+        """Schedule a single :attr:`displaysChanged` for a burst of screen signals."""
+        del args
+        self._displays = None
+        self._changed_timer.start()
+
+    def displays(self) -> List[DisplayInfo]:
+        key = setup_key()
+        if self._displays is None or self._displays[0] != key:
+            primary = QtGui.QGuiApplication.primaryScreen()
+            screens = [screen_info(screen, primary=screen is primary) for screen in QtGui.QGuiApplication.screens()]
+            self._displays = key, merge_displays(screens, self._xrandr.lookup(key) or [])
+        return list(self._displays[1])
+
+    def primary(self) -> DisplayInfo | None:
+        displays = self.displays()
+        for info in displays:
+            if info.primary:
+                return info
+        return displays[0] if displays else None
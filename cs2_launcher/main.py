@@ -8,14 +8,18 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from . import theme
+from .display import DisplayProbe, preset_resolutions
+
 
 APP_NAME = "CS2 Dark Aether Launcher"
 SETTINGS_PATH = Path.home() / ".cs2_dark_aether_settings.json"
 STEAM_APP_ID = "730"
+MIN_REFRESH_RATE = 24
 
 
 class AnimatedButton(QtWidgets.QPushButton):
@@ -24,7 +28,7 @@ class AnimatedButton(QtWidgets.QPushButton):
     def __init__(self, label: str, *, accent_color: QtGui.QColor, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(label, parent=parent)
         self.accent_color = accent_color
-        self._setup_style()
+        self.setFont(theme.themed_font(16, letter_spacing=2))
         self._effect = QtWidgets.QGraphicsDropShadowEffect(self)
         self._effect.setBlurRadius(0)
         self._effect.setColor(self.accent_color)
@@ -37,23 +41,9 @@ class AnimatedButton(QtWidgets.QPushButton):
         self._animation.setEndValue(30)
         self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
 
-    def _setup_style(self) -> None:
-        self.setStyleSheet(
-            """
-            QPushButton {
-                background-color: rgba(20, 20, 35, 200);
-                color: #f5f5f5;
-                border: 2px solid rgba(120, 120, 255, 120);
-                border-radius: 10px;
-                padding: 12px 22px;
-                font-size: 16px;
-                letter-spacing: 2px;
-            }
-            QPushButton:pressed {
-                background-color: rgba(45, 45, 70, 220);
-            }
-            """
-        )
+    def set_accent_color(self, color: QtGui.QColor) -> None:
+        self.accent_color = color
+        self._effect.setColor(color)
 
     def enterEvent(self, event: QtCore.QEvent) -> None:  # noqa: N802 - Qt API
         self._animation.setDirection(QtCore.QAbstractAnimation.Direction.Forward)
@@ -72,23 +62,21 @@ class NeonFrame(QtWidgets.QFrame):
     def __init__(self, *, accent_color: QtGui.QColor, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._accent_color = accent_color
+        self._bloom_enabled = True
         self.setObjectName("neonFrame")
-        self.setStyleSheet(
-            f"""
-            QFrame#neonFrame {{
-                background: rgba(10, 10, 25, 200);
-                border-radius: 18px;
-                border: 1px solid rgba({accent_color.red()}, {accent_color.green()}, {accent_color.blue()}, 150);
-            }}
-            """
-        )
         self._drop_shadow = QtWidgets.QGraphicsDropShadowEffect(self)
         self._drop_shadow.setBlurRadius(40)
         self._drop_shadow.setColor(self._accent_color)
         self._drop_shadow.setOffset(0)
         self.setGraphicsEffect(self._drop_shadow)
 
+    def set_accent_color(self, color: QtGui.QColor) -> None:
+        self._accent_color = color
+        self.set_bloom_enabled(self._bloom_enabled)
+        self.update()
+
     def set_bloom_enabled(self, enabled: bool) -> None:
+        self._bloom_enabled = enabled
         self._drop_shadow.setEnabled(True)
         self._drop_shadow.setBlurRadius(55 if enabled else 15)
         if enabled:
@@ -97,23 +85,37 @@ class NeonFrame(QtWidgets.QFrame):
             muted = QtGui.QColor(40, 40, 60, 180)
             self._drop_shadow.setColor(muted)
 
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802 - Qt API
+        del event
+        painter = QtGui.QPainter(self)
+        theme.paint_rounded_panel(
+            painter,
+            self.rect(),
+            fill=QtGui.QColor(10, 10, 25, 200),
+            border=theme.with_alpha(self._accent_color, 150),
+            radius=18,
+        )
+        painter.end()
+
 
 class ResolutionSelector(QtWidgets.QWidget):
     """Widget to choose resolution presets or custom values."""
 
     resolutionChanged = QtCore.Signal(int, int)
 
+    FALLBACK_PRESETS = [
+        (1920, 1080),
+        (2560, 1440),
+        (3840, 2160),
+        (1280, 720),
+        (1280, 960),
+        (1024, 768),
+        (800, 600),
+    ]
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self._presets = [
-            (1920, 1080),
-            (2560, 1440),
-            (3840, 2160),
-            (1280, 720),
-            (1280, 960),
-            (1024, 768),
-            (800, 600),
-        ]
+        self._presets = list(self.FALLBACK_PRESETS)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -122,9 +124,7 @@ class ResolutionSelector(QtWidgets.QWidget):
         layout.setHorizontalSpacing(12)
 
         self.preset_box = QtWidgets.QComboBox()
-        for width, height in self._presets:
-            self.preset_box.addItem(f"{width} x {height}", (width, height))
-        self.preset_box.addItem("Custom", None)
+        self._populate_presets([(preset, False) for preset in self._presets])
         self.preset_box.currentIndexChanged.connect(self._on_preset_changed)
 
         self.width_spin = QtWidgets.QSpinBox()
@@ -146,6 +146,22 @@ class ResolutionSelector(QtWidgets.QWidget):
         # Initialize with first preset
         self._set_resolution(*self._presets[0])
 
+    def _populate_presets(self, presets: List[Tuple[Tuple[int, int], bool]]) -> None:
+        self._presets = [size for size, _native in presets]
+        self.preset_box.clear()
+        for (width, height), native in presets:
+            label = f"{width} x {height} (native)" if native else f"{width} x {height}"
+            self.preset_box.addItem(label, (width, height))
+        self.preset_box.addItem("Custom", None)
+
+    def set_presets(self, presets: List[Tuple[Tuple[int, int], bool]]) -> None:
+        """Replace the preset list, keeping the current resolution selected."""
+        width, height = self.get_resolution()
+        self.preset_box.blockSignals(True)
+        self._populate_presets(presets)
+        self.preset_box.blockSignals(False)
+        self.set_resolution(width, height)
+
     def _set_resolution(self, width: int, height: int) -> None:
         self.width_spin.blockSignals(True)
         self.height_spin.blockSignals(True)
@@ -186,23 +202,14 @@ class ResolutionSelector(QtWidgets.QWidget):
 class ThemePreview(QtWidgets.QLabel):
     """Displays the current background image with zoom-on-hover."""
 
-    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+    def __init__(self, *, accent_color: QtGui.QColor, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setMinimumSize(200, 110)
         self.setScaledContents(True)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet(
-            """
-            QLabel {
-                border-radius: 14px;
-                border: 1px solid rgba(120, 120, 255, 80);
-                background: rgba(30, 30, 50, 120);
-                color: rgba(250, 250, 250, 180);
-                font-size: 13px;
-                letter-spacing: 1px;
-            }
-            """
-        )
+        self.setFont(theme.themed_font(13, letter_spacing=1))
+        theme.tint(self, QtGui.QColor(250, 250, 250, 180))
+        self._accent_color = accent_color
         self._pixmap: QtGui.QPixmap | None = None
 
     def set_image(self, image_path: Path | None) -> None:
@@ -221,6 +228,22 @@ class ThemePreview(QtWidgets.QLabel):
             self.setText("No Theme Selected")
             self._pixmap = None
 
+    def set_accent_color(self, color: QtGui.QColor) -> None:
+        self._accent_color = color
+        self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802 - Qt API
+        painter = QtGui.QPainter(self)
+        theme.paint_rounded_panel(
+            painter,
+            self.rect(),
+            fill=QtGui.QColor(30, 30, 50, 120),
+            border=theme.with_alpha(self._accent_color, 80),
+            radius=14,
+        )
+        painter.end()
+        super().paintEvent(event)
+
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # noqa: N802 - Qt API
         super().resizeEvent(event)
         if self._pixmap:
@@ -257,6 +280,50 @@ class ScanlineOverlay(QtWidgets.QWidget):
         painter.end()
 
 
+class AetherBackdrop(QtWidgets.QWidget):
+    """Central backdrop painting the wallpaper or the default gradient."""
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self._image: QtGui.QImage | None = None
+        self._scaled: QtGui.QPixmap | None = None
+
+    def set_image(self, image_path: Path | None) -> None:
+        image = QtGui.QImage(str(image_path)) if image_path and image_path.exists() else QtGui.QImage()
+        self._image = None if image.isNull() else image
+        self._scaled = None
+        self.update()
+
+    def _scaled_image(self) -> QtGui.QPixmap | None:
+        if self._image is None:
+            return None
+        if self._scaled is None or self._scaled.size() != self.size():
+            # Scale to cover once per size, then crop to the widget centre.
+            covered = self._image.scaled(
+                self.size(),
+                QtCore.Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+            crop = QtCore.QRect(QtCore.QPoint(0, 0), self.size())
+            crop.moveCenter(covered.rect().center())
+            self._scaled = QtGui.QPixmap.fromImage(covered.copy(crop))
+        return self._scaled
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802 - Qt API
+        painter = QtGui.QPainter(self)
+        scaled = self._scaled_image()
+        if scaled is not None:
+            painter.drawPixmap(event.rect(), scaled, event.rect())
+        else:
+            gradient = QtGui.QLinearGradient(0, 0, self.width(), self.height())
+            gradient.setColorAt(0.0, QtGui.QColor("#04040e"))
+            gradient.setColorAt(0.5, QtGui.QColor("#10102a"))
+            gradient.setColorAt(1.0, QtGui.QColor("#04040e"))
+            painter.fillRect(event.rect(), gradient)
+        painter.end()
+
+
 class LauncherWindow(QtWidgets.QMainWindow):
     launched = QtCore.Signal()
 
@@ -265,16 +332,18 @@ class LauncherWindow(QtWidgets.QMainWindow):
         self.setWindowTitle(APP_NAME)
         self.resize(960, 600)
         self.setMinimumSize(820, 520)
-        self.accent_color = QtGui.QColor(130, 120, 255)
+        self.accent_color = QtGui.QColor(theme.DEFAULT_ACCENT)
         self.settings: Dict[str, object] = {}
         self.background_path: Path | None = None
+        self.display_probe = DisplayProbe(self)
+        self.display_probe.displaysChanged.connect(self._on_displays_changed)
+        self._install_theme()
         self._build_ui()
-        self._apply_global_style()
         self._load_settings()
 
     # region UI Setup
     def _build_ui(self) -> None:
-        central_widget = QtWidgets.QWidget()
+        central_widget = AetherBackdrop()
         self.setCentralWidget(central_widget)
 
         main_layout = QtWidgets.QVBoxLayout(central_widget)
@@ -283,16 +352,8 @@ class LauncherWindow(QtWidgets.QMainWindow):
 
         header_label = QtWidgets.QLabel("CS2 DARK AETHER")
         header_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        header_label.setStyleSheet(
-            """
-            QLabel {
-                font-size: 34px;
-                font-weight: 700;
-                letter-spacing: 10px;
-                color: #d2d3ff;
-            }
-            """
-        )
+        header_label.setFont(theme.themed_font(34, weight=QtGui.QFont.Weight.Bold, letter_spacing=10))
+        theme.tint(header_label, QtGui.QColor("#d2d3ff"))
         main_layout.addWidget(header_label)
 
         content_layout = QtWidgets.QHBoxLayout()
@@ -305,20 +366,23 @@ class LauncherWindow(QtWidgets.QMainWindow):
         control_layout.setContentsMargins(26, 26, 26, 26)
 
         self.resolution_selector = ResolutionSelector()
+        self._apply_display_presets()
         self.window_mode_box = QtWidgets.QComboBox()
         self.window_mode_box.addItems(["Fullscreen", "Borderless", "Windowed"])
 
         refresh_layout = QtWidgets.QHBoxLayout()
         self.refresh_spin = QtWidgets.QSpinBox()
-        self.refresh_spin.setRange(60, 1000)
-        self.refresh_spin.setValue(240)
+        self.refresh_spin.setRange(MIN_REFRESH_RATE, 1000)
+        self._default_resolution, self._default_refresh = self._native_defaults()
+        self.refresh_spin.setValue(self._default_refresh)
         self.refresh_spin.setSuffix(" Hz")
         refresh_layout.addWidget(QtWidgets.QLabel("Refresh"))
         refresh_layout.addWidget(self.refresh_spin)
         refresh_layout.addStretch()
 
         launch_options_label = QtWidgets.QLabel("Launch Options")
-        launch_options_label.setStyleSheet("font-size: 16px; font-weight: 600; color: #c8c9ff;")
+        launch_options_label.setFont(theme.themed_font(16, weight=QtGui.QFont.Weight.DemiBold))
+        theme.tint(launch_options_label, QtGui.QColor("#c8c9ff"))
 
         self.novid_checkbox = QtWidgets.QCheckBox("Skip Intro Videos (-novid)")
         self.high_priority_checkbox = QtWidgets.QCheckBox("High Priority (+mat_queue_mode 2)")
@@ -353,9 +417,10 @@ class LauncherWindow(QtWidgets.QMainWindow):
         theme_layout.setSpacing(16)
 
         theme_header = QtWidgets.QLabel("Theme & Atmosphere")
-        theme_header.setStyleSheet("font-size: 18px; font-weight: 600; letter-spacing: 2px; color: #d7d7ff;")
+        theme_header.setFont(theme.themed_font(18, weight=QtGui.QFont.Weight.DemiBold, letter_spacing=2))
+        theme.tint(theme_header, QtGui.QColor("#d7d7ff"))
 
-        self.theme_preview = ThemePreview()
+        self.theme_preview = ThemePreview(accent_color=self.accent_color)
         theme_layout.addWidget(theme_header)
         theme_layout.addWidget(self.theme_preview)
 
@@ -388,47 +453,32 @@ class LauncherWindow(QtWidgets.QMainWindow):
 
         self.status_label = QtWidgets.QLabel("Ready to breach.")
         self.status_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("color: #9fa0ff; font-size: 15px; letter-spacing: 2px;")
+        self.status_label.setFont(theme.themed_font(15, letter_spacing=2))
+        theme.tint(self.status_label, QtGui.QColor("#9fa0ff"))
         main_layout.addWidget(self.status_label)
 
         self._init_ambient_effects(central_widget)
         self._sync_atmosphere_effects()
 
-    def _apply_global_style(self) -> None:
-        palette = self.palette()
-        palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(4, 4, 12))
-        palette.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(230, 230, 250))
-        self.setPalette(palette)
-
-        self.setStyleSheet(
-            """
-            QWidget {
-                font-family: 'Rajdhani', 'Montserrat', 'Segoe UI', sans-serif;
-                color: #f7f7ff;
-            }
-            QComboBox, QSpinBox, QCheckBox {
-                background: rgba(20, 20, 35, 160);
-                border: 1px solid rgba(120, 120, 255, 80);
-                border-radius: 8px;
-                padding: 8px;
-                selection-background-color: rgba(120, 120, 255, 140);
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 1px solid rgba(120, 120, 255, 150);
-                background: rgba(10, 10, 30, 200);
-            }
-            QCheckBox::indicator:checked {
-                background: rgba(170, 150, 255, 220);
-                border: 1px solid rgba(220, 210, 255, 220);
-            }
-            QLabel {
-                color: rgba(220, 220, 255, 200);
-            }
-            """
-        )
+    def _install_theme(self) -> None:
+        app = QtWidgets.QApplication.instance()
+        self.theme_style = theme.install_theme(app, self.accent_color)
+
+    def set_accent_color(self, color: QtGui.QColor) -> None:
+        """Swap the accent color and repaint without re-polishing widgets."""
+        self.accent_color = QtGui.QColor(color)
+        self.theme_style.set_accent_color(self.accent_color)
+        for frame in (self.control_frame, self.theme_frame):
+            frame.set_accent_color(self.accent_color)
+        for button in (
+            self.launch_button,
+            self.cfg_button,
+            self.select_background_button,
+            self.reset_background_button,
+        ):
+            button.set_accent_color(self.accent_color)
+        self.theme_preview.set_accent_color(self.accent_color)
+        self.update()
 
     def _init_ambient_effects(self, central_widget: QtWidgets.QWidget) -> None:
         # Particle overlay
@@ -436,7 +486,8 @@ class LauncherWindow(QtWidgets.QMainWindow):
         self.scanline_overlay.hide()
 
         self.particle_view = QtWidgets.QGraphicsView(central_widget)
-        self.particle_view.setStyleSheet("background: transparent; border: none;")
+        self.particle_view.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.particle_view.viewport().setAutoFillBackground(False)
         self.particle_view.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.particle_view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.particle_view.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -464,6 +515,8 @@ class LauncherWindow(QtWidgets.QMainWindow):
         else:
             self.particle_view.setVisible(False)
             self._particle_timer.stop()
+            for animation in self.particle_scene.findChildren(QtCore.QVariantAnimation):
+                animation.stop()
             self.particle_scene.clear()
 
         scanlines_enabled = self.scanline_checkbox.isChecked()
@@ -483,9 +536,10 @@ class LauncherWindow(QtWidgets.QMainWindow):
         else:
             self.settings = {}
 
-        width = int(self.settings.get("width", 1920))
-        height = int(self.settings.get("height", 1080))
-        refresh = int(self.settings.get("refresh", 240))
+        default_width, default_height = self._default_resolution
+        width = int(self.settings.get("width", default_width))
+        height = int(self.settings.get("height", default_height))
+        refresh = int(self.settings.get("refresh", self._default_refresh))
         window_mode = self.settings.get("window_mode", "Fullscreen")
         background = self.settings.get("background" )
         novid = bool(self.settings.get("novid", True))
@@ -552,21 +606,37 @@ class LauncherWindow(QtWidgets.QMainWindow):
         self._set_status("Theme reset to default darkness.")
 
     def _update_background_style(self) -> None:
-        if self.background_path and self.background_path.exists():
-            self.centralWidget().setStyleSheet(
-                f"background-image: url('{self.background_path.as_posix()}');"
-                "background-position: center;"
-                "background-repeat: no-repeat;"
-                "background-size: cover;"
-                ""
-            )
-        else:
-            self.centralWidget().setStyleSheet(
-                "background: qlineargradient(x1:0, y1:0, x2:1, y2:1,"
-                " stop:0 #04040e, stop:0.5 #10102a, stop:1 #04040e);"
-            )
+        self.centralWidget().set_image(self.background_path)
 
     def _launch_cs2(self) -> None:
+        warning = self._native_mode_warning()
+        if warning:
+            answer = QtWidgets.QMessageBox.warning(
+                self,
+                "Non-Native Display Mode",
+                f"{warning}\n\nLaunch anyway?",
+                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
+                QtWidgets.QMessageBox.StandardButton.No,
+            )
+            if answer != QtWidgets.QMessageBox.StandardButton.Yes:
+                self._set_status("Launch held. Match your display mode.")
+                return
+
+        steam_cmd = self._detect_steam_command()
+        if not steam_cmd:
+            QtWidgets.QMessageBox.critical(self, "Steam Not Found", "Unable to locate the Steam executable.")
+            return
+
+        try:
+            subprocess.Popen(self._build_launch_args(steam_cmd))
+            self._set_status("Deploying CS2 with your specs.")
+            self._save_settings()
+            self.launched.emit()
+        except OSError as exc:
+            QtWidgets.QMessageBox.critical(self, "Launch Failed", f"Failed to launch CS2: {exc}")
+            self._set_status("Launch failed. Check settings.")
+
+    def _build_launch_args(self, steam_cmd: str) -> List[str]:
         width, height = self.resolution_selector.get_resolution()
         refresh = self.refresh_spin.value()
         window_mode_flag = {
@@ -585,23 +655,11 @@ class LauncherWindow(QtWidgets.QMainWindow):
             "+mat_queue_mode 2" if self.high_priority_checkbox.isChecked() else "",
         ]
 
-        steam_cmd = self._detect_steam_command()
-        if not steam_cmd:
-            QtWidgets.QMessageBox.critical(self, "Steam Not Found", "Unable to locate the Steam executable.")
-            return
-
-        try:
-            launch_list = [steam_cmd, "-applaunch", STEAM_APP_ID]
-            for arg in commands:
-                if arg:
-                    launch_list.extend(arg.split())
-            subprocess.Popen(launch_list)
-            self._set_status("Deploying CS2 with your specs.")
-            self._save_settings()
-            self.launched.emit()
-        except OSError as exc:
-            QtWidgets.QMessageBox.critical(self, "Launch Failed", f"Failed to launch CS2: {exc}")
-            self._set_status("Launch failed. Check settings.")
+        launch_list = [steam_cmd, "-applaunch", STEAM_APP_ID]
+        for arg in commands:
+            if arg:
+                launch_list.extend(arg.split())
+        return launch_list
 
     def _open_cfg_folder(self) -> None:
         cfg_path = self._get_cfg_path()
@@ -619,6 +677,47 @@ class LauncherWindow(QtWidgets.QMainWindow):
     # endregion
 
     # region Helpers
+    def _apply_display_presets(self) -> None:
+        presets = preset_resolutions(self.display_probe.displays(), ResolutionSelector.FALLBACK_PRESETS)
+        self.resolution_selector.set_presets(presets)
+
+    def _on_displays_changed(self) -> None:
+        self._apply_display_presets()
+        # Follow the new screen's native mode unless the user picked their own.
+        native_resolution, native_refresh = self._native_defaults()
+        if self.resolution_selector.get_resolution() == self._default_resolution:
+            self.resolution_selector.set_resolution(*native_resolution)
+        if self.refresh_spin.value() == self._default_refresh:
+            self.refresh_spin.setValue(native_refresh)
+        self._default_resolution, self._default_refresh = native_resolution, native_refresh
+
+    def _native_defaults(self) -> Tuple[Tuple[int, int], int]:
+        """Return the default resolution and refresh rate, both from the primary display's native mode."""
+        display = self.display_probe.primary()
+        if display is None:
+            return (1920, 1080), 240
+        native = display.native
+        refresh = max(MIN_REFRESH_RATE, round(native.refresh_rate)) if native.refresh_rate > 0 else 240
+        return native.size, refresh
+
+    def _native_mode_warning(self) -> str | None:
+        """Describe why the fullscreen mode would not run natively, if it would not."""
+        if self.window_mode_box.currentText() != "Fullscreen":
+            return None
+        display = self.display_probe.primary()
+        if display is None:
+            return None
+        width, height = self.resolution_selector.get_resolution()
+        refresh = self.refresh_spin.value()
+        if display.is_native(width, height, refresh):
+            return None
+        native = display.native
+        return (
+            f"{width} x {height} @ {refresh} Hz is not a native mode of {display.name or 'your display'} "
+            f"(native {native.width} x {native.height} @ {native.refresh_rate:g} Hz). "
+            "CS2 may run scaled or at a lower refresh rate."
+        )
+
     def _detect_steam_command(self) -> str | None:
         if platform.system() == "Windows":
             possible_paths = [
@@ -671,11 +770,14 @@ class LauncherWindow(QtWidgets.QMainWindow):
         start_y = area.height()
         ellipse.setPos(start_x, start_y)
 
-        animation = QtCore.QPropertyAnimation(ellipse, b"pos")
+        # Graphics items are not QObjects, so drive the position from a
+        # variant animation owned by the scene.
+        animation = QtCore.QVariantAnimation(self.particle_scene)
         animation.setDuration(6000)
         animation.setStartValue(QtCore.QPointF(start_x, start_y))
         animation.setEndValue(QtCore.QPointF(start_x, -50))
         animation.setEasingCurve(QtCore.QEasingCurve.Type.InOutQuad)
+        animation.valueChanged.connect(ellipse.setPos)
         animation.finished.connect(lambda: self.particle_scene.removeItem(ellipse))
         animation.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
 
@@ -695,7 +797,6 @@ class LauncherWindow(QtWidgets.QMainWindow):
 
 
 def run() -> int:
-    QtWidgets.QApplication.setAttribute(QtCore.Qt.WidgetAttribute.AA_UseHighDpiPixmaps)
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     window = LauncherWindow()
@@ -0,0 +1,283 @@
+"""Palette and proxy-style theme engine for the Dark Aether look.
+
+Every control is painted directly by :class:`AetherStyle` instead of going
+through Qt style sheets, so widgets never pay for ``QStyleSheetStyle`` rule
+matching at construction or repaint time.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+
+DEFAULT_ACCENT = QtGui.QColor(130, 120, 255)
+FONT_FAMILIES = ["Rajdhani", "Montserrat", "Segoe UI", "sans-serif"]
+
+BACKGROUND = QtGui.QColor(4, 4, 12)
+TEXT = QtGui.QColor(247, 247, 255)
+LABEL_TEXT = QtGui.QColor(220, 220, 255, 200)
+BUTTON_TEXT = QtGui.QColor(245, 245, 245)
+SELECTION = QtGui.QColor(120, 120, 255, 140)
+
+FIELD_FILL = QtGui.QColor(20, 20, 35, 160)
+BUTTON_FILL = QtGui.QColor(20, 20, 35, 200)
+BUTTON_PRESSED_FILL = QtGui.QColor(45, 45, 70, 220)
+INDICATOR_FILL = QtGui.QColor(10, 10, 30, 200)
+INDICATOR_CHECKED_FILL = QtGui.QColor(170, 150, 255, 220)
+INDICATOR_CHECKED_BORDER = QtGui.QColor(220, 210, 255, 220)
+
+FIELD_RADIUS = 8
+FIELD_PADDING = 8
+BUTTON_RADIUS = 10
+BUTTON_PADDING = (22, 12)
+BUTTON_BORDER = 2
+INDICATOR_SIZE = 18
+INDICATOR_RADIUS = 4
+
+_State = QtWidgets.QStyle.StateFlag
+_PE = QtWidgets.QStyle.PrimitiveElement
+_CE = QtWidgets.QStyle.ControlElement
+_CC = QtWidgets.QStyle.ComplexControl
+_SC = QtWidgets.QStyle.SubControl
+_SE = QtWidgets.QStyle.SubElement
+_CT = QtWidgets.QStyle.ContentsType
+_PM = QtWidgets.QStyle.PixelMetric
+
+
+def with_alpha(color: QtGui.QColor, alpha: int) -> QtGui.QColor:
+    tinted = QtGui.QColor(color)
+    tinted.setAlpha(alpha)
+    return tinted
+
+
+def paint_rounded_panel(
+    painter: QtGui.QPainter,
+    rect: QtCore.QRect | QtCore.QRectF,
+    *,
+    fill: QtGui.QColor,
+    border: QtGui.QColor,
+    radius: float,
+    border_width: float = 1.0,
+) -> None:
+    """Fill ``rect`` with a rounded panel whose outline stays inside the rect.
+
+    Panels are rasterized once per size and color and then blitted from
+    :class:`QtGui.QPixmapCache`, so repaints skip antialiased path filling.
+    """
+    rect = QtCore.QRectF(rect).toAlignedRect()
+    if rect.isEmpty():
+        return
+    ratio = painter.device().devicePixelRatioF()
+    key = (
+        f"aether-panel-{rect.width()}x{rect.height()}@{ratio}-{fill.rgba():08x}-{border.rgba():08x}"
+        f"-{radius}-{border_width}"
+    )
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        half = border_width / 2
+        panel_painter = QtGui.QPainter(pixmap)
+        panel_painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        panel_painter.setPen(QtGui.QPen(border, border_width))
+        panel_painter.setBrush(fill)
+        panel_painter.drawRoundedRect(
+            QtCore.QRectF(0, 0, rect.width(), rect.height()).adjusted(half, half, -half, -half), radius, radius
+        )
+        panel_painter.end()
+        QtGui.QPixmapCache.insert(key, pixmap)
+    painter.drawPixmap(rect.topLeft(), pixmap)
+
+
+def themed_font(
+    pixel_size: int,
+    *,
+    weight: QtGui.QFont.Weight = QtGui.QFont.Weight.Normal,
+    letter_spacing: float = 0.0,
+    families: Sequence[str] = FONT_FAMILIES,
+) -> QtGui.QFont:
+    font = QtGui.QFont()
+    font.setFamilies(list(families))
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    if letter_spacing:
+        font.setLetterSpacing(QtGui.QFont.SpacingType.AbsoluteSpacing, letter_spacing)
+    return font
+
+
+def tint(widget: QtWidgets.QWidget, color: QtGui.QColor) -> None:
+    """Set the foreground color of a label-like widget through its palette."""
+    palette = widget.palette()
+    palette.setColor(QtGui.QPalette.ColorRole.WindowText, color)
+    widget.setPalette(palette)
+
+
+def build_palette() -> QtGui.QPalette:
+    palette = QtGui.QPalette()
+    Role = QtGui.QPalette.ColorRole
+    palette.setColor(Role.Window, BACKGROUND)
+    palette.setColor(Role.WindowText, LABEL_TEXT)
+    palette.setColor(Role.Base, QtGui.QColor(20, 20, 35))
+    palette.setColor(Role.AlternateBase, QtGui.QColor(28, 28, 48))
+    palette.setColor(Role.Text, TEXT)
+    palette.setColor(Role.PlaceholderText, LABEL_TEXT)
+    palette.setColor(Role.Button, QtGui.QColor(20, 20, 35))
+    palette.setColor(Role.ButtonText, BUTTON_TEXT)
+    palette.setColor(Role.Highlight, SELECTION)
+    palette.setColor(Role.HighlightedText, TEXT)
+    palette.setColor(Role.ToolTipBase, QtGui.QColor(20, 20, 35))
+    palette.setColor(Role.ToolTipText, TEXT)
+    disabled = with_alpha(TEXT, 110)
+    for role in (Role.WindowText, Role.Text, Role.ButtonText):
+        palette.setColor(QtGui.QPalette.ColorGroup.Disabled, role, disabled)
+    return palette
+
+
+class AetherStyle(QtWidgets.QProxyStyle):
+    """Fusion-based proxy style that paints the Dark Aether controls.
+
+    The accent color only feeds painting, so :meth:`set_accent_color`
+    followed by a repaint is enough to restyle the UI; no widget is
+    re-polished.
+    """
+
+    def __init__(self, accent_color: QtGui.QColor = DEFAULT_ACCENT) -> None:
+        super().__init__("Fusion")
+        self._accent_color = QtGui.QColor(accent_color)
+
+    @property
+    def accent_color(self) -> QtGui.QColor:
+        return QtGui.QColor(self._accent_color)
+
+    def set_accent_color(self, color: QtGui.QColor) -> None:
+        self._accent_color = QtGui.QColor(color)
+
+    def _accent(self, alpha: int) -> QtGui.QColor:
+        return with_alpha(self._accent_color, alpha)
+
+    def _paint_field(self, painter: QtGui.QPainter, rect: QtCore.QRect) -> None:
+        paint_rounded_panel(painter, rect, fill=FIELD_FILL, border=self._accent(80), radius=FIELD_RADIUS)
+
+    # region Painting
+    def drawPrimitive(self, element, option, painter, widget=None) -> None:  # noqa: N802 - Qt API
+        if element == _PE.PE_PanelButtonCommand:
+            pressed = bool(option.state & (_State.State_Sunken | _State.State_On))
+            paint_rounded_panel(
+                painter,
+                option.rect,
+                fill=BUTTON_PRESSED_FILL if pressed else BUTTON_FILL,
+                border=self._accent(120),
+                radius=BUTTON_RADIUS,
+                border_width=BUTTON_BORDER,
+            )
+            return
+        if element == _PE.PE_IndicatorCheckBox:
+            checked = bool(option.state & _State.State_On)
+            paint_rounded_panel(
+                painter,
+                option.rect,
+                fill=INDICATOR_CHECKED_FILL if checked else INDICATOR_FILL,
+                border=INDICATOR_CHECKED_BORDER if checked else self._accent(150),
+                radius=INDICATOR_RADIUS,
+            )
+            return
+        if element == _PE.PE_PanelLineEdit:
+            # Line edits embedded in spin boxes have no frame and sit on the
+            # field panel drawn by the parent control.
+            if isinstance(option, QtWidgets.QStyleOptionFrame) and option.lineWidth > 0:
+                self._paint_field(painter, option.rect)
+            return
+        if element in (_PE.PE_FrameLineEdit, _PE.PE_FrameFocusRect):
+            return
+        super().drawPrimitive(element, option, painter, widget)
+
+    def drawControl(self, element, option, painter, widget=None) -> None:  # noqa: N802 - Qt API
+        if element == _CE.CE_CheckBox and isinstance(option, QtWidgets.QStyleOptionButton):
+            self._paint_field(painter, option.rect)
+            # Check box captions use the brighter field text, not the label tone.
+            palette = QtGui.QPalette(option.palette)
+            palette.setColor(QtGui.QPalette.ColorRole.WindowText, palette.color(QtGui.QPalette.ColorRole.Text))
+            # Compose the parts here: the base style lays them out without
+            # consulting this proxy's padded sub-element rects.
+            sub_option = QtWidgets.QStyleOptionButton(option)
+            sub_option.palette = palette
+            sub_option.rect = self.subElementRect(_SE.SE_CheckBoxIndicator, option, widget)
+            self.drawPrimitive(_PE.PE_IndicatorCheckBox, sub_option, painter, widget)
+            sub_option.rect = self.subElementRect(_SE.SE_CheckBoxContents, option, widget)
+            super().drawControl(_CE.CE_CheckBoxLabel, sub_option, painter, widget)
+            return
+        super().drawControl(element, option, painter, widget)
+
+    def drawComplexControl(self, control, option, painter, widget=None) -> None:  # noqa: N802 - Qt API
+        if control == _CC.CC_ComboBox and isinstance(option, QtWidgets.QStyleOptionComboBox):
+            self._paint_field(painter, option.rect)
+            self._draw_arrow(_PE.PE_IndicatorArrowDown, control, _SC.SC_ComboBoxArrow, option, painter, widget)
+            return
+        if control == _CC.CC_SpinBox and isinstance(option, QtWidgets.QStyleOptionSpinBox):
+            self._paint_field(painter, option.rect)
+            if option.buttonSymbols != QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons:
+                self._draw_arrow(_PE.PE_IndicatorArrowUp, control, _SC.SC_SpinBoxUp, option, painter, widget)
+                self._draw_arrow(_PE.PE_IndicatorArrowDown, control, _SC.SC_SpinBoxDown, option, painter, widget)
+            return
+        super().drawComplexControl(control, option, painter, widget)
+
+    def _draw_arrow(self, arrow, control, sub_control, option, painter, widget) -> None:
+        arrow_option = QtWidgets.QStyleOption(option)
+        arrow_option.rect = self.subControlRect(control, option, sub_control, widget)
+        super().drawPrimitive(arrow, arrow_option, painter, widget)
+
+    # endregion
+
+    # region Metrics
+    def pixelMetric(self, metric, option=None, widget=None) -> int:  # noqa: N802 - Qt API
+        if metric in (_PM.PM_IndicatorWidth, _PM.PM_IndicatorHeight):
+            return INDICATOR_SIZE
+        return super().pixelMetric(metric, option, widget)
+
+    def sizeFromContents(self, contents_type, option, size, widget=None) -> QtCore.QSize:  # noqa: N802 - Qt API
+        if contents_type == _CT.CT_PushButton:
+            pad_x, pad_y = BUTTON_PADDING
+            return QtCore.QSize(
+                size.width() + 2 * (pad_x + BUTTON_BORDER),
+                size.height() + 2 * (pad_y + BUTTON_BORDER),
+            )
+        base = super().sizeFromContents(contents_type, option, size, widget)
+        if contents_type == _CT.CT_CheckBox:
+            return base + QtCore.QSize(2 * FIELD_PADDING, 2 * FIELD_PADDING)
+        if contents_type in (_CT.CT_ComboBox, _CT.CT_SpinBox):
+            return base + QtCore.QSize(FIELD_PADDING, FIELD_PADDING)
+        return base
+
+    def subElementRect(self, element, option, widget=None) -> QtCore.QRect:  # noqa: N802 - Qt API
+        rect = super().subElementRect(element, option, widget)
+        if element in (_SE.SE_CheckBoxIndicator, _SE.SE_CheckBoxContents, _SE.SE_CheckBoxFocusRect):
+            return rect.translated(FIELD_PADDING, 0)
+        return rect
+
+    def subControlRect(self, control, option, sub_control, widget=None) -> QtCore.QRect:  # noqa: N802 - Qt API
+        rect = super().subControlRect(control, option, sub_control, widget)
+        if (control, sub_control) in ((_CC.CC_ComboBox, _SC.SC_ComboBoxEditField), (_CC.CC_SpinBox, _SC.SC_SpinBoxEditField)):
+            return rect.adjusted(FIELD_PADDING // 2, 0, 0, 0)
+        return rect
+
+    # endregion
+
+
+def install_theme(app: QtWidgets.QApplication, accent_color: QtGui.QColor = DEFAULT_ACCENT) -> AetherStyle:
+    """Install the Aether style, palette and font on ``app`` once.
+
+    Later calls reuse the installed style and only swap its accent color.
+    """
+    style = app.style()
+    if isinstance(style, AetherStyle):
+        style.set_accent_color(accent_color)
+        return style
+    style = AetherStyle(accent_color)
+    app.setStyle(style)
+    app.setPalette(build_palette())
+    font = app.font()
+    font.setFamilies(FONT_FAMILIES)
+    app.setFont(font)
+    return style
@@ -0,0 +1,119 @@
+"""Parsing and preset tests for :mod:`cs2_launcher.display` using canned ``xrandr --query`` output."""
+from cs2_launcher.display import (
+    DEFAULT_DPI,
+    DisplayInfo,
+    DisplayMode,
+    merge_displays,
+    parse_xrandr,
+    preset_resolutions,
+)
+
+
+DUAL_MONITOR = """\
+Screen 0: minimum 320 x 200, current 3840 x 1080, maximum 16384 x 16384
+DP-1 connected primary 1920x1080+0+0 (normal left inverted right x axis y axis) 597mm x 336mm
+   2560x1440     59.95 +  143.97
+   1920x1080     60.00*   50.00
+   1280x720      60.00
+HDMI-1 connected 1920x1080+1920+0 (normal left inverted right x axis y axis) 527mm x 296mm
+   1920x1080     60.00*+  50.00
+   1920x1080i    60.00    50.00
+   1280x720      60.00
+DP-2 disconnected (normal left inverted right x axis y axis)
+VGA-1 connected (normal left inverted right x axis y axis)
+   1024x768      60.00 +  75.00
+"""
+
+XWAYLAND = """\
+Screen 0: minimum 16 x 16, current 3840 x 1440, maximum 32767 x 32767
+XWAYLAND0 connected 2560x1440+0+0 (normal left inverted right x axis y axis) 600mm x 340mm
+   2560x1440    143.91*+
+   1920x1080    143.88
+XWAYLAND1 connected 1280x1024+2560+0 (normal left inverted right x axis y axis) 380mm x 300mm
+   1280x1024     59.89*+
+"""
+
+FALLBACK = [(1920, 1080), (2560, 1440), (3840, 2160), (1280, 720), (800, 600)]
+
+
+def _by_name(displays):
+    return {info.name: info for info in displays}
+
+
+def test_parses_primary_and_secondary_outputs():
+    displays = _by_name(parse_xrandr(DUAL_MONITOR))
+
+    assert list(displays) == ["DP-1", "HDMI-1", "VGA-1"]
+    assert displays["DP-1"].primary
+    assert not displays["HDMI-1"].primary
+    assert displays["DP-1"].geometry == (0, 0, 1920, 1080)
+    assert displays["HDMI-1"].geometry == (1920, 0, 1920, 1080)
+    assert displays["DP-1"].dpi == 108.9
+
+
+def test_disabled_output_has_no_geometry():
+    vga = _by_name(parse_xrandr(DUAL_MONITOR))["VGA-1"]
+
+    assert vga.geometry is None
+    assert vga.native == DisplayMode(1024, 768, 75.0)
+    assert vga.dpi == DEFAULT_DPI
+
+
+def test_preferred_flag_picks_native_size_over_active_mode():
+    displays = _by_name(parse_xrandr(DUAL_MONITOR))
+
+    # " +" after 59.95 marks 2560x1440 preferred although 1920x1080 is active.
+    assert displays["DP-1"].native == DisplayMode(2560, 1440, 143.97)
+    # "*+" marks the same rate active and preferred.
+    assert displays["HDMI-1"].native == DisplayMode(1920, 1080, 60.0)
+
+
+def test_interlaced_modes_do_not_end_the_mode_list():
+    hdmi = _by_name(parse_xrandr(DUAL_MONITOR))["HDMI-1"]
+
+    assert DisplayMode(1920, 1080, 50.0) in hdmi.modes
+    assert DisplayMode(1280, 720, 60.0) in hdmi.modes
+
+
+def test_is_native_requires_the_native_size_and_rate():
+    dp1 = _by_name(parse_xrandr(DUAL_MONITOR))["DP-1"]
+
+    assert dp1.is_native(2560, 1440, 144)
+    assert not dp1.is_native(2560, 1440, 60)
+    assert not dp1.is_native(1920, 1080, 60)
+
+
+def test_xwayland_outputs_match_qt_screens_by_geometry():
+    screen = DisplayInfo(
+        name="DP-3",
+        native=DisplayMode(2560, 1440, 144.0),
+        dpi=DEFAULT_DPI,
+        primary=True,
+        modes=(DisplayMode(2560, 1440, 144.0),),
+        geometry=(0, 0, 2560, 1440),
+    )
+
+    merged = merge_displays([screen], parse_xrandr(XWAYLAND))
+
+    assert len(merged) == 1
+    assert merged[0].name == "DP-3"
+    assert merged[0].primary
+    assert merged[0].native == DisplayMode(2560, 1440, 143.91)
+    assert DisplayMode(1920, 1080, 143.88) in merged[0].modes
+    assert merged[0].dpi == 108.4
+
+
+def test_presets_list_native_modes_first_then_supported_then_fallback():
+    presets = preset_resolutions(parse_xrandr(DUAL_MONITOR), FALLBACK)
+
+    assert presets == [
+        ((2560, 1440), True),
+        ((1920, 1080), True),
+        ((1024, 768), True),
+        ((1280, 720), False),
+        ((800, 600), False),
+    ]
+
+
+def test_presets_fall_back_without_displays():
+    assert preset_resolutions([], FALLBACK) == [(size, False) for size in FALLBACK]